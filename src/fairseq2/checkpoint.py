@@ -4,6 +4,7 @@
 # This source code is licensed under the BSD-style license found in the
 # LICENSE file in the root directory of this source tree.
 
+import os
 from abc import ABC, abstractmethod
 from contextlib import nullcontext
 from pathlib import Path
@@ -659,12 +660,19 @@ class FileCheckpointManager(CheckpointManager):
 
     @override
     def has_checkpoint(self, step_nr: Optional[int] = None) -> bool:
-        it = self._iter_step_numbers()
-
         if step_nr is None:
-            return next(it, None) is not None
+            return next(self._iter_step_numbers(), None) is not None
+
+        # No need to traverse the whole base directory for a single step; a
+        # direct lookup costs one metadata operation on the file system.
+        step_dir = self._checkpoint_dir.joinpath(f"step_{step_nr}")
 
-        return step_nr in it
+        try:
+            return step_dir.is_dir()
+        except OSError as ex:
+            raise RuntimeError(
+                "The base checkpoint directory cannot be traversed. See nested exception for details."
+            ) from ex
 
     @override
     def get_step_numbers(self) -> List[int]:
@@ -684,16 +692,21 @@ class FileCheckpointManager(CheckpointManager):
 
     def _iter_step_numbers(self) -> Iterator[int]:
         try:
-            for step_dir in self._checkpoint_dir.glob("step_*"):
-                if not step_dir.is_dir():
-                    continue
+            # `DirEntry` caches the file type reported by the directory listing,
+            # which saves us an extra stat call per entry compared to `glob()`.
+            with os.scandir(self._checkpoint_dir) as it:
+                for entry in it:
+                    if not entry.name.startswith("step_") or not entry.is_dir():
+                        continue
 
-                try:
-                    step_nr = int(step_dir.name[5:])
-                except ValueError:
-                    continue
+                    try:
+                        step_nr = int(entry.name[5:])
+                    except ValueError:
+                        continue
 
-                yield step_nr
+                    yield step_nr
+        except FileNotFoundError:
+            return
         except OSError as ex:
             raise RuntimeError(
                 "The base checkpoint directory cannot be traversed. See nested exception for details."
@@ -754,19 +767,21 @@ class CheckpointModelMetadataProvider(AbstractAssetMetadataProvider):
         )
 
         try:
-            for step_dir in self._checkpoint_dir.glob("step_*"):
-                if not step_dir.is_dir():
-                    continue
+            with os.scandir(self._checkpoint_dir) as it:
+                for entry in it:
+                    if not entry.name.startswith("step_") or not entry.is_dir():
+                        continue
 
-                try:
-                    step_nr = int(step_dir.name[5:])
-                except ValueError:
-                    continue
+                    try:
+                        step_nr = int(entry.name[5:])
+                    except ValueError:
+                        continue
 
-                add_checkpoint_metadata(
-                    f"checkpoint_step_{step_nr}@", step_dir.joinpath(filename)
-                )
+                    step_dir = self._checkpoint_dir.joinpath(entry.name)
 
+                    add_checkpoint_metadata(
+                        f"checkpoint_step_{step_nr}@", step_dir.joinpath(filename)
+                    )
         except OSError as ex:
             raise RuntimeError(
                 "The base checkpoint directory cannot be traversed. See nested exception for details."
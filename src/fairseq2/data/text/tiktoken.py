@@ -232,9 +232,9 @@ class TiktokenDecoder(TextTokenDecoder):
             )
 
         # Do not decode special tokens.
-        indices = [i for i in token_indices.tolist() if i < self._num_bpe_tokens]
+        token_indices = token_indices[token_indices < self._num_bpe_tokens]
 
-        return self._encoding.decode(indices)
+        return self._encoding.decode(token_indices.tolist())
 
     @override
     def decode_from_tokens(self, tokens: Sequence[str]) -> str:
@@ -861,13 +861,14 @@ class _AbstractBeamSearchSequenceGeneratorOp(ABC):
         seq = seq.clone()
 
         # (S_out)
-        step_scores = self._step_scores[seq_idx, start_step:seq_len]
+        cum_scores = self._step_scores[seq_idx, start_step:seq_len]
 
         # Similar to `seqs`, do not keep `step_scores` in memory.
-        step_scores = step_scores.clone()
+        step_scores = cum_scores.clone()
 
-        # Convert from cumulative to per-step scores.
-        step_scores[1:] = step_scores[1:] - step_scores[:-1]
+        # Convert from cumulative to per-step scores. Subtract in-place from
+        # the original view to avoid allocating an intermediate difference.
+        step_scores[1:].sub_(cum_scores[:-1])
 
         if self._normalize_scores:
             # Since the first step's score is always 0, do not include it in
@@ -83,7 +83,7 @@ class SequenceBatch:
     def num_target_elements(self) -> int:
         """Return the number of target elements in the batch."""
         if self.target_mask is not None:
-            return int(self.target_mask.sum())
+            return int(torch.count_nonzero(self.target_mask))
 
         return self.num_elements()
 
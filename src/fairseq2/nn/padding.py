@@ -51,9 +51,9 @@ class PaddingMask:
             bool_mask = self.materialize()
 
             # (N, S)
-            mask = torch.zeros_like(bool_mask, dtype=seqs.dtype)
+            mask = torch.full_like(bool_mask, -torch.inf, dtype=seqs.dtype)
 
-            mask = torch.where(bool_mask, mask, -torch.inf)
+            mask.masked_fill_(bool_mask, 0.0)
 
             self._materialized_float = mask
 
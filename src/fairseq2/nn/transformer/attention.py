@@ -257,9 +257,9 @@ def _naive_scaled_dot_product_attention(
     training: bool,
 ) -> Tuple[Tensor, Optional[Tensor]]:
     # (N, H, S, K) @ (N, H, K, S_kv) = (N, H, S, S_kv)
-    attn_weights = torch.matmul(seqs, keys.transpose(-1, -2))
+    attn_weights = torch.matmul(seqs, keys.mT)
 
-    attn_weights = attn_weights * (seqs.size(-1) ** -0.5)
+    attn_weights.mul_(seqs.size(-1) ** -0.5)
 
     if attn_mask is not None:
         # (S, S_kv)
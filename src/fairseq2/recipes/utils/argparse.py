@@ -52,11 +52,11 @@ class ConfigAction(Action):
         data: Dict[str, Any] = {}
 
         for item in values:
-            key_value = item.split("=", maxsplit=1)
-            if len(key_value) != 2:
+            key, sep, value = item.partition("=")
+            if not sep:
                 raise ArgumentError(self, f"invalid key-value pair: {item}")
 
-            key, value = [kv.strip() for kv in key_value]
+            key, value = key.strip(), value.strip()
 
             try:
                 parsed_value = yaml.safe_load(value)
@@ -85,7 +85,7 @@ class ConfigAction(Action):
 
                     tmp[field] = d
 
-                    tmp = d
+                tmp = d
 
             tmp[fields[-1]] = parsed_value
 